@@ -2,18 +2,24 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Iterable
+import argparse
 import csv
 import html
+import os
 import re
 import shutil
+import sys
 
 
 
 from dataclasses import dataclass
 from pathlib import Path
 from datetime import date
+from functools import lru_cache
 
 @dataclass(frozen=True)
 class SiteConfig:
@@ -139,6 +145,7 @@ CityWithCol = tuple[str, str, float]
 
 def load_cities_from_csv(path: Path) -> tuple[CityWithCol, ...]:
   cities: list[CityWithCol] = []
+  seen: dict[str, tuple[int, float]] = {}  # slug -> (CSV line, col)
 
   with path.open(newline="", encoding="utf-8") as f:
     reader = csv.DictReader(f)
@@ -152,7 +159,8 @@ def load_cities_from_csv(path: Path) -> tuple[CityWithCol, ...]:
 
     for i, row in enumerate(reader, start=2):  # header is line 1
       city = (row.get("city") or "").strip()
-      state = (row.get("state") or "").strip().upper()
+      # Only ~50 distinct state codes across hundreds of rows; share them.
+      state = sys.intern((row.get("state") or "").strip().upper())
       col_raw = (row.get("col") or "").strip()
 
       if not city or not state or not col_raw:
@@ -165,12 +173,29 @@ def load_cities_from_csv(path: Path) -> tuple[CityWithCol, ...]:
             f"Invalid col value at CSV line {i}: {col_raw!r}"
         ) from e
 
+      # Cities that slug to the same page (e.g. "St. Louis"/"St Louis") would
+      # render and write the same output twice. An exact repeat is skipped with
+      # a warning; a repeat with a different col is a data error.
+      key = city_state_slug(city, state)
+      if key in seen:
+        first_line, first_col = seen[key]
+        if col != first_col:
+          raise ValueError(
+              f"Conflicting duplicate city at CSV line {i}: {city}, {state} "
+              f"(col {col} vs {first_col} at line {first_line})"
+          )
+        print(
+            f"warning: duplicate city at CSV line {i}: {city}, {state} "
+            f"(same as line {first_line}); skipping",
+            file=sys.stderr,
+        )
+        continue
+      seen[key] = (i, col)
+
       cities.append((city, state, col))
 
   return tuple(cities)
 
-CITIES: tuple[CityWithCol, ...] = CONFIG.load_cities()
-
 
 
 """
@@ -191,18 +216,31 @@ ALSO_MENTIONED = [
 # -----------------------
 # HELPERS
 # -----------------------
+_NEEDS_ESCAPE_RE = re.compile(r"[&<>\"']")
+
+
 def esc(s: str) -> str:
+    # Most inputs (city names, labels, slugs) have nothing to escape.
+    if _NEEDS_ESCAPE_RE.search(s) is None:
+        return s
     return html.escape(s, quote=True)
 
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+@lru_cache(maxsize=None)
 def slugify(s: str) -> str:
-    s = s.strip().lower()
-    s = re.sub(r"&", " and ", s)
-    s = re.sub(r"[^a-z0-9]+", "-", s)
-    s = re.sub(r"-{2,}", "-", s).strip("-")
-    return s
+    # Output is always [a-z0-9-]*, so slugs are safe to drop into URLs, HTML
+    # attributes and XML unescaped; callers rely on this.
+    s = s.strip().lower().replace("&", " and ")
+    # One pass collapses every run of non-alphanumerics (so no "--" survives).
+    return _SLUG_RE.sub("-", s).strip("-")
 
 
+# Memoized: each city's slug is needed when loading (dedupe), for its output
+# path, its canonical URL and the sitemap; state slugs repeat across cities.
+@lru_cache(maxsize=None)
 def city_state_slug(city: str, state: str) -> str:
     return f"{slugify(city)}-{slugify(state)}"
 
@@ -217,22 +255,135 @@ def city_title(city: str, state: str) -> str:
     return clamp_title(f"{CONFIG.h1_short} in {city}, {state}", 70)
 
 
-def write_text(out_path: Path, content: str) -> None:
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(content, encoding="utf-8")
-
-
-def reset_output_dir(p: Path) -> None:
+def file_matches(path: Path, data: bytes) -> bool:
+    # Cheap size check first; only read the file back when it could match.
+    try:
+        if path.stat().st_size != len(data):
+            return False
+        return path.read_bytes() == data
+    except FileNotFoundError:
+        return False
+
+
+@dataclass
+class BuildState:
+  # Filesystem bookkeeping for one build; main() starts each run with a fresh
+  # one so nothing carries over between builds in the same process.
+
+  # Directories known to exist (created or seen) during this build.
+  created_dirs: set[Path] = field(default_factory=set)
+  # Every output path produced this build, whether rewritten or already up to
+  # date; anything else left in the output dir is stale (see prune_output_dir).
+  written_paths: set[Path] = field(default_factory=set)
+
+
+def ensure_dir(state: BuildState, p: Path) -> None:
+    # Several files share a parent (public/ itself); only hit the filesystem
+    # the first time a directory is seen in this build.
+    if p not in state.created_dirs:
+        p.mkdir(parents=True, exist_ok=True)
+        state.created_dirs.add(p)
+
+
+def note_existing_dirs(state: BuildState, p: Path) -> None:
+    # On an in-place rebuild the page dirs already exist: one listing of p up
+    # front replaces a failing mkdir (EEXIST) per page in ensure_dir.
+    with os.scandir(p) as entries:
+        state.created_dirs.update(p / e.name for e in entries if e.is_dir(follow_symlinks=False))
+
+
+def write_bytes(state: BuildState, out_path: Path, content: bytes) -> None:
+    state.written_paths.add(out_path)
+    ensure_dir(state, out_path.parent)
+    # Leave identical files (and their mtimes) alone so deploys only pick up
+    # pages that actually changed.
+    if file_matches(out_path, content):
+        return
+    # Hand the whole buffer to the kernel instead of going through the
+    # buffered/text I/O layers.
+    data = memoryview(content)
+    # O_BINARY (Windows only) keeps os.write from translating LF to CRLF.
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(out_path, flags, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+def write_text(state: BuildState, out_path: Path, content: str) -> None:
+    # Pages are small and fully built in memory: encode once.
+    write_bytes(state, out_path, content.encode("utf-8"))
+
+
+def reset_output_dir(state: BuildState, p: Path) -> None:
     if p.exists():
         shutil.rmtree(p)
-    p.mkdir(parents=True, exist_ok=True)
-
-
-def copy_site_image(*, src_dir: Path, out_dir: Path, filename: str) -> None:
+        # Directories recorded under p are gone now; forget them all.
+        state.created_dirs.clear()
+    ensure_dir(state, p)
+
+
+def prune_output_dir(state: BuildState, p: Path) -> None:
+    # Without a full reset, pages for cities dropped from the CSV would linger;
+    # remove every file this run did not produce, then any emptied dirs.
+    for root, _, files in os.walk(p, topdown=False):
+        root_path = Path(root)
+        for name in files:
+            if root_path / name not in state.written_paths:
+                (root_path / name).unlink()
+        if root_path != p and not any(root_path.iterdir()):
+            root_path.rmdir()
+            state.created_dirs.discard(root_path)
+
+
+def files_match(a: Path, b: Path, chunk_size: int = 1 << 20) -> bool:
+    # Like file_matches, but streams both files so large assets are not read
+    # into memory whole; mtimes are ignored since copies may preserve them.
+    try:
+        if a.stat().st_size != b.stat().st_size:
+            return False
+        with a.open("rb") as fa, b.open("rb") as fb:
+            while True:
+                chunk = fa.read(chunk_size)
+                if chunk != fb.read(chunk_size):
+                    return False
+                if not chunk:
+                    return True
+    except FileNotFoundError:
+        return False
+
+
+def copy_file_in_kernel(src: Path, dst: Path) -> None:
+    # shutil.copyfile already copies in-kernel (sendfile) on Linux; what
+    # copy_file_range adds is reflinking on CoW filesystems. It must never
+    # leave a worse copy than the fallback, so any shortfall is an error.
+    with src.open("rb") as fsrc, dst.open("wb") as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        while remaining > 0:
+            n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+            if n == 0:
+                raise OSError(f"copy_file_range stopped with {remaining} bytes left: {src}")
+            remaining -= n
+
+
+def copy_site_image(state: BuildState, *, src_dir: Path, out_dir: Path, filename: str) -> None:
     src = src_dir / filename
     if not src.exists():
         raise FileNotFoundError(f"Missing image next to generate.py: {src}")
-    shutil.copyfile(src, out_dir / filename)
+    dst = out_dir / filename
+    state.written_paths.add(dst)
+    # Same content as a past build's copy: leave it (and its mtime) alone.
+    if files_match(src, dst):
+        return
+    if hasattr(os, "copy_file_range"):
+        try:
+            copy_file_in_kernel(src, dst)
+            return
+        except OSError:
+            pass  # e.g. unsupported by this filesystem; use the portable path
+    shutil.copyfile(src, dst)
 
 
 # -----------------------
@@ -616,29 +767,38 @@ footer{
 # -----------------------
 # HTML BUILDING BLOCKS
 # -----------------------
+# Fragments that only depend on CONFIG and appear on every page (nav, footer);
+# escape them once.
+_BRAND_ESC = esc(CONFIG.brand_name)
+_CTA_HTML = f'<a class="btn" href="{esc(CONFIG.cta_href)}">{esc(CONFIG.cta_text)}</a>'
+
+
+# Only a handful of distinct navs/footers exist (one per nav key / CTA flag),
+# so build each once and reuse it for every page.
+@lru_cache(maxsize=None)
 def nav_html(current: str) -> str:
     def item(href: str, label: str, key: str) -> str:
         cur = ' aria-current="page"' if current == key else ""
         return f'<a href="{esc(href)}"{cur}>{esc(label)}</a>'
 
-    return (
-        '<nav class="nav" aria-label="Primary navigation">'
-        + item("/", "Home", "home")
-        + item("/cost/", "Cost", "cost")
-        + item("/how-to/", "How-To", "howto")
-        + f'<a class="btn" href="{esc(CONFIG.cta_href)}">{esc(CONFIG.cta_text)}</a>'
-        + "</nav>"
-    )
+    return "".join((
+        '<nav class="nav" aria-label="Primary navigation">',
+        item("/", "Home", "home"),
+        item("/cost/", "Cost", "cost"),
+        item("/how-to/", "How-To", "howto"),
+        _CTA_HTML,
+        "</nav>",
+    ))
 
 
-def base_html(*, title: str, canonical_path: str, current_nav: str, body: str) -> str:
-    # title == h1 is enforced by callers; keep this thin.
+def base_html(*, title_html: str, canonical_path: str, current_nav: str, body: str) -> str:
+    # title == h1 is enforced by callers, which pass it already escaped.
     return f"""<!doctype html>
 <html lang="en">
 <head>
   <meta charset="utf-8" />
   <meta name="viewport" content="width=device-width, initial-scale=1" />
-  <title>{esc(title)}</title>
+  <title>{title_html}</title>
   <link rel="canonical" href="{esc(canonical_path)}" />
   <style>
 {CSS}
@@ -647,7 +807,7 @@ def base_html(*, title: str, canonical_path: str, current_nav: str, body: str) -
 <body>
   <div class="topbar">
     <div class="topbar-inner">
-      <a class="brand" href="/">{esc(CONFIG.brand_name)}</a>
+      <a class="brand" href="/">{_BRAND_ESC}</a>
       {nav_html(current_nav)}
     </div>
   </div>
@@ -657,11 +817,11 @@ def base_html(*, title: str, canonical_path: str, current_nav: str, body: str) -
 """
 
 
-def header_block(*, h1: str, sub: str) -> str:
+def header_block(*, h1_html: str, sub: str) -> str:
     return f"""
 <header>
   <div class="hero">
-    <h1>{esc(h1)}</h1>
+    <h1>{h1_html}</h1>
     <p class="sub">{esc(sub)}</p>
   </div>
 </header>
@@ -678,6 +838,7 @@ def contact_header_block(*, h1: str, sub: str) -> str:
 """.rstrip()
 
 
+@lru_cache(maxsize=None)
 def footer_block(*, show_cta: bool = True) -> str:
     cta_html = ""
     if show_cta:
@@ -685,7 +846,7 @@ def footer_block(*, show_cta: bool = True) -> str:
     <h2>Next steps</h2>
     <p class="sub">Ready to move forward? Request a free quote.</p>
     <div>
-      <a class="btn" href="{esc(CONFIG.cta_href)}">{esc(CONFIG.cta_text)}</a>
+      {_CTA_HTML}
     </div>
 """
 
@@ -698,35 +859,36 @@ def footer_block(*, show_cta: bool = True) -> str:
       <a href="/cost/">Cost</a>
       <a href="/how-to/">How-To</a>
     </div>
-    <div class="small">© {esc(CONFIG.brand_name)}. All rights reserved.</div>
+    <div class="small">© {_BRAND_ESC}. All rights reserved.</div>
   </div>
 </footer>
 """.rstrip()
 
 
 
-def page_shell(*, h1: str, sub: str, inner_html: str, show_image: bool = True, show_footer_cta: bool = True) -> str:
-    img_src = f"/{CONFIG.image_filename}"
-    img_html = ""
-    if show_image:
-        img_html = f"""
+_IMG_SRC = f"/{CONFIG.image_filename}"
+_IMG_HTML = f"""
     <div class="img">
-      <img src="{esc(img_src)}" alt="Service image" loading="lazy" />
+      <img src="{esc(_IMG_SRC)}" alt="Service image" loading="lazy" />
     </div>
 """.rstrip()
 
-    return (
-        header_block(h1=h1, sub=sub)
-        + f"""
+
+def page_shell(*, h1_html: str, sub: str, inner_html: str, show_image: bool = True, show_footer_cta: bool = True) -> str:
+    img_html = _IMG_HTML if show_image else ""
+
+    return "".join((
+        header_block(h1_html=h1_html, sub=sub),
+        f"""
 <main>
   <section class="card">
 {img_html}
     {inner_html}
   </section>
 </main>
-"""
-        + footer_block(show_cta=show_footer_cta)
-    ).rstrip()
+""",
+        footer_block(show_cta=show_footer_cta),
+    )).rstrip()
 
 
 
@@ -734,19 +896,26 @@ def page_shell(*, h1: str, sub: str, inner_html: str, show_image: bool = True, s
 # CONTENT SECTIONS
 # -----------------------
 
-def linkify_curly(text: str) -> str:
+_CURLY_RE = re.compile(r"\{([^}]+)\}")
+
+
+def linkify_curly(text: str, fills: dict[str, str] | None = None) -> str:
   """
-  Replace {word} with a link to the homepage using that word as link text
+  Replace {word} with a link to the homepage using that word as link text,
+  unless word is a key of fills, whose (already-HTML) value is used instead
   """
   parts = []
   last = 0
 
-  for m in re.finditer(r"\{([^}]+)\}", text):
+  for m in _CURLY_RE.finditer(text):
     # text before the match
     parts.append(esc(text[last:m.start()]))
 
     word = m.group(1)
-    parts.append(f'<a href="/">{esc(word)}</a>')
+    if fills and word in fills:
+      parts.append(fills[word])
+    else:
+      parts.append(f'<a href="/">{esc(word)}</a>')
 
     last = m.end()
 
@@ -755,13 +924,26 @@ def linkify_curly(text: str) -> str:
 
   return "".join(parts)
 
-def make_section(*, headings: list[str], paras:  list[str]) -> str:
+def make_section(*, headings: list[str], paras:  list[str], fills: dict[str, str] | None = None) -> str:
   parts = []
   for h2, p in zip(headings, paras):
     parts.append(f"<h2>{esc(h2)}</h2>")
-    parts.append(f"<p>{linkify_curly(p)}</p>")
+    parts.append(f"<p>{linkify_curly(p, fills)}</p>")
   return "\n".join(parts)
 
+# The shared guide copy never varies between pages; render each section once
+# instead of re-escaping and re-linking it for the homepage and every city.
+_MAIN_SECTIONS_HTML = make_section(headings=CONFIG.main_h2, paras=CONFIG.main_p)
+_COST_SECTIONS_HTML = make_section(
+    headings=CONFIG.cost_h2,
+    paras=CONFIG.cost_p,
+    fills={
+        "cost_lo": f"<strong>${CONFIG.cost_low}</strong>",
+        "cost_hi": f"<strong>${CONFIG.cost_high}</strong>",
+    },
+)
+_HOWTO_SECTIONS_HTML = make_section(headings=CONFIG.howto_h2, paras=CONFIG.howto_p)
+
 def location_cost_section(city: str, state: str, col: float) -> str:
     cost_lo = f"<strong>${int(CONFIG.cost_low * col)}</strong>"
     cost_hi = f"<strong>${int(CONFIG.cost_high * col)}</strong>"
@@ -770,14 +952,15 @@ def location_cost_section(city: str, state: str, col: float) -> str:
         "{City, State}", f"{city}, {state}"
     )
 
-    p = (
-        CONFIG.location_cost_p
-        .replace("<strong>{City, State}", f"{city}, {state}</strong>")
-        .replace("{cost_lo}", cost_lo)
-        .replace("{cost_hi}", cost_hi)
-    )
+    # Same placeholder handling as the shared sections: fills are HTML, any
+    # other {phrase} becomes a link.
+    p = linkify_curly(CONFIG.location_cost_p, {
+        "City, State": esc(f"{city}, {state}"),
+        "cost_lo": cost_lo,
+        "cost_hi": cost_hi,
+    })
 
-    return f"<h2>{esc(h2)}</h2>\n<p>{esc(p)}</p>"
+    return f"<h2>{esc(h2)}</h2>\n<p>{p}</p>"
 
 
 def city_cost_callout_html(city: str, state: str) -> str:
@@ -796,31 +979,35 @@ def city_cost_callout_html(city: str, state: str) -> str:
 # PAGE FACTORY
 # -----------------------
 def make_page(*, h1: str, canonical: str, nav_key: str, sub: str, inner: str, show_image: bool = True, show_footer_cta: bool = True) -> str:
-    h1 = clamp_title(h1, 70)
-    title = h1  # enforce title == h1
+    # Escape once; the same string is the <title> and the <h1> (title == h1).
+    h1_html = esc(clamp_title(h1, 70))
     return base_html(
-        title=title,
+        title_html=h1_html,
         canonical_path=canonical,
         current_nav=nav_key,
-        body=page_shell(h1=h1, sub=sub, inner_html=inner, show_image=show_image, show_footer_cta=show_footer_cta),
+        body=page_shell(h1_html=h1_html, sub=sub, inner_html=inner, show_image=show_image, show_footer_cta=show_footer_cta),
     )
 
 
-def homepage_html() -> str:
-    city_links = "\n".join(
-        f'<li><a href="{esc("/" + city_state_slug(city, state) + "/")}">{esc(city)}, {esc(state)}</a></li>'
-        for city, state, _ in CITIES
-    )
-    inner = (
-        make_section(headings=CONFIG.main_h2, paras=CONFIG.main_p)
-        + """
+def city_grid_html(cities: tuple[CityWithCol, ...]) -> str:
+    city_links = "\n".join([
+        # Slugs are [a-z0-9-] only (see slugify), so the href needs no escaping.
+        f'<li><a href="/{city_state_slug(city, state)}/">{esc(city)}, {esc(state)}</a></li>'
+        for city, state, _ in cities
+    ])
+    return f'<ul class="city-grid">\n{city_links}\n</ul>'
+
+
+def homepage_html(cities: tuple[CityWithCol, ...]) -> str:
+    inner = "".join((
+        _MAIN_SECTIONS_HTML,
+        """
 <hr />
 <h2>Choose your city</h2>
 <p class="muted">We provide services nationwide, including in the following cities:</p>
-<ul class="city-grid">
-"""
-        + city_links
-    )
+""",
+        city_grid_html(cities),
+    ))
 
     return make_page(
         h1=CONFIG.h1_title,
@@ -889,10 +1076,10 @@ def contact_page_html() -> str:
 
 
 def city_page_html(city: str, state: str, col: float) -> str:
-    inner = (
-      location_cost_section(city, state, col)
-      + make_section(headings=CONFIG.main_h2, paras=CONFIG.main_p)
-    )
+    inner = "".join((
+      location_cost_section(city, state, col),
+      _MAIN_SECTIONS_HTML,
+    ))
 
     return make_page(
         h1=city_title(city, state),
@@ -903,13 +1090,19 @@ def city_page_html(city: str, state: str, col: float) -> str:
     )
 
 
+def render_city(city: CityWithCol) -> tuple[str, str]:
+    # Top-level and pure so it can be shipped to worker processes.
+    name, state, col = city
+    return city_state_slug(name, state), city_page_html(name, state, col)
+
+
 def cost_page_html() -> str:
     return make_page(
         h1=CONFIG.cost_title,
         canonical="/cost/",
         nav_key="cost",
         sub=CONFIG.cost_sub,
-        inner=make_section(headings=CONFIG.cost_h2, paras=CONFIG.cost_p),
+        inner=_COST_SECTIONS_HTML,
     )
 
 
@@ -919,7 +1112,7 @@ def howto_page_html() -> str:
         canonical="/how-to/",
         nav_key="howto",
         sub=CONFIG.howto_sub,
-        inner=make_section(headings=CONFIG.howto_h2, paras=CONFIG.howto_p),
+        inner=_HOWTO_SECTIONS_HTML,
     )
 
 
@@ -930,13 +1123,20 @@ def robots_txt() -> str:
     return "User-agent: *\nAllow: /\nSitemap: /sitemap.xml\n"
 
 
-def sitemap_xml(urls: list[str]) -> str:
-    return (
-        '<?xml version="1.0" encoding="UTF-8"?>\n'
-        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
-        + "".join(f"  <url><loc>{u}</loc></url>\n" for u in urls)
-        + "</urlset>\n"
+def sitemap_xml(urls: list[str]) -> bytes:
+    buf = bytearray(
+        b'<?xml version="1.0" encoding="UTF-8"?>\n'
+        b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
     )
+    # URLs are fixed paths plus slugs, which are [a-z0-9-] by construction
+    # (see slugify), so they go in without XML escaping. encode("ascii") makes
+    # any violation of that contract fail loudly instead of emitting bad XML.
+    for u in urls:
+        buf += b"  <url><loc>"
+        buf += u.encode("ascii")
+        buf += b"</loc></url>\n"
+    buf += b"</urlset>\n"
+    return bytes(buf)
 
 def wrangler_content() -> str:
     name = CONFIG.base_name.lower().replace(" ", "-")
@@ -955,30 +1155,75 @@ def wrangler_content() -> str:
 # -----------------------
 # MAIN
 # -----------------------
-def main() -> None:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+  parser = argparse.ArgumentParser(description="Generate the static site into the output directory.")
+  parser.add_argument(
+      "--jobs",
+      type=int,
+      default=1,
+      help="render city pages in this many worker processes (default: 1, in-process)",
+  )
+  parser.add_argument(
+      "--clean",
+      action="store_true",
+      help="delete the output directory and rebuild every file from scratch",
+  )
+  args = parser.parse_args(argv)
+  if args.jobs < 1:
+      parser.error("--jobs must be at least 1")
+  return args
+
+
+def main(argv: list[str] | None = None) -> None:
+  args = parse_args(argv)
   script_dir = Path(__file__).resolve().parent
   out = CONFIG.output_dir
+  # Loaded here rather than at import so importing the module stays cheap and
+  # the city rows are released once the build finishes.
+  cities = CONFIG.load_cities()
+
+  state = BuildState()
 
-  reset_output_dir(out)
+  # By default rebuild in place: unchanged files are left untouched (see
+  # write_bytes) and stale ones are pruned at the end.
+  if args.clean:
+      reset_output_dir(state, out)
+  else:
+      ensure_dir(state, out)
+      note_existing_dirs(state, out)
 
   # Copy the single shared image into /public/ so all pages can reference "/picture.png".
-  copy_site_image(src_dir=script_dir, out_dir=out, filename=CONFIG.image_filename)
+  copy_site_image(state, src_dir=script_dir, out_dir=out, filename=CONFIG.image_filename)
 
   # Core pages
-  write_text(out / "index.html", homepage_html())
-  write_text(out / "cost" / "index.html", cost_page_html())
-  write_text(out / "how-to" / "index.html", howto_page_html())
-  write_text(out / "contact" / "index.html", contact_page_html())
-
-  # City pages
-  for city, state, col in CITIES:
-      write_text(out / city_state_slug(city, state) / "index.html", city_page_html(city, state, col))
+  write_text(state, out / "index.html", homepage_html(cities))
+  write_text(state, out / "cost" / "index.html", cost_page_html())
+  write_text(state, out / "how-to" / "index.html", howto_page_html())
+  write_text(state, out / "contact" / "index.html", contact_page_html())
+
+  urls = ["/", "/cost/", "/how-to/"]
+
+  # City pages. Rendering is pure and can fan out to worker processes; writes
+  # stay in this process so output order is deterministic. For a few hundred
+  # cities the pool start-up costs more than it saves, hence the opt-in.
+  # The sitemap URLs are collected in the same pass.
+  def emit(pages: Iterable[tuple[str, str]]) -> None:
+      for slug, page in pages:
+          write_text(state, out / slug / "index.html", page)
+          urls.append(f"/{slug}/")
+
+  if args.jobs > 1:
+      with ProcessPoolExecutor(max_workers=args.jobs) as ex:
+          emit(ex.map(render_city, cities, chunksize=32))
+  else:
+      emit(map(render_city, cities))
 
   # robots + sitemap + wrangler
-  urls = ["/", "/cost/", "/how-to/"] + [f"/{city_state_slug(c, s)}/" for c, s, _ in CITIES]
-  write_text(out / "robots.txt", robots_txt())
-  write_text(out / "sitemap.xml", sitemap_xml(urls))
-  write_text(script_dir / "wrangler.jsonc", wrangler_content())
+  write_text(state, out / "robots.txt", robots_txt())
+  write_bytes(state, out / "sitemap.xml", sitemap_xml(urls))
+  write_text(state, script_dir / "wrangler.jsonc", wrangler_content())
+
+  prune_output_dir(state, out)
 
   print(f"✅ Generated {len(urls)} pages into: {out.resolve()}")
 